@@ -207,6 +207,9 @@ class RouteSerializer(TaggitSerializer, serializers.ModelSerializer):
         # Build structured response for each available route type
         available_routes = []
 
+        # Build mesh information, the same for every route type
+        mesh_info = self._build_mesh_info(instance)
+
         for route_type in ("traveltime", "fuel"):
             smoothed = smoothed_routes[route_type]
             unsmoothed = unsmoothed_routes[route_type]
@@ -242,9 +245,6 @@ class RouteSerializer(TaggitSerializer, serializers.ModelSerializer):
                 route_type, properties
             )
 
-            # Build mesh information
-            mesh_info = self._build_mesh_info(instance)
-
             # Build structured route object
             route_obj = {
                 "type": route_type,
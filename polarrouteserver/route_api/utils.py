@@ -6,7 +6,14 @@ from tempfile import NamedTemporaryFile
 from typing import Union
 
 from django.conf import settings
+from django.db.models import F
+from django.db.models.functions import Abs
 import haversine
+from haversine.haversine import get_avg_earth_radius
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+import numpy as np
+from polar_route.config_validation.vessel_schema import vessel_schema
 from polar_route.route_calc import route_calc
 from polar_route.utils import convert_decimal_days
 
@@ -14,15 +21,25 @@ from .models import Mesh, Route
 
 logger = logging.getLogger(__name__)
 
+# the only columns needed to match existing routes against requested waypoints
+ROUTE_COORDINATE_FIELDS = ("id", "start_lat", "start_lon", "end_lat", "end_lon")
+
+# checking the schema and building the validator is done once, not per request
+_vessel_schema_validator_class = validator_for(vessel_schema)
+_vessel_schema_validator_class.check_schema(vessel_schema)
+_VESSEL_SCHEMA_VALIDATOR = _vessel_schema_validator_class(vessel_schema)
+
 
 def select_mesh(
     start_lat: float,
     start_lon: float,
     end_lat: float,
     end_lon: float,
+    limit: Union[int, None] = None,
 ) -> Union[list[Mesh], None]:
     """Find the most suitable mesh from the database for a given set of start and end coordinates.
-    Returns either a list of Mesh objects or None.
+    Returns either a list of Mesh objects, smallest first, or None.
+    If limit is given, at most that many meshes are returned.
     """
 
     try:
@@ -42,11 +59,16 @@ def select_mesh(
         # get the date of the most recently created mesh
         latest_date = containing_meshes.latest("created").created.date()
 
-        # get all valid meshes from that creation date
-        valid_meshes = containing_meshes.filter(created__date=latest_date)
+        # get all valid meshes from that creation date, ordered smallest first
+        # (same metric as Mesh.size, but evaluated by the database)
+        valid_meshes = containing_meshes.filter(created__date=latest_date).order_by(
+            Abs(F("lat_max") - F("lat_min")) * Abs(F("lon_max") - F("lon_min")), "id"
+        )
+
+        if limit is not None:
+            valid_meshes = valid_meshes[:limit]
 
-        # return the smallest
-        return sorted(valid_meshes, key=lambda mesh: mesh.size)
+        return list(valid_meshes)
 
     except Mesh.DoesNotExist:
         return None
@@ -68,7 +90,12 @@ def route_exists(
         meshes = [meshes]
 
     for mesh in meshes:
-        same_mesh_routes = Route.objects.filter(mesh=mesh)
+        # avoid loading the route geojson, only the coordinates are compared
+        same_mesh_routes = list(
+            Route.objects.filter(mesh=mesh)
+            .only(*ROUTE_COORDINATE_FIELDS)
+            .prefetch_related("job_set")
+        )
 
         # use set to preserve uniqueness
         successful_route_ids = set()
@@ -80,24 +107,23 @@ def route_exists(
                 if job.status != "FAILURE":
                     successful_route_ids.add(route.id)
 
-        successful_routes = same_mesh_routes.filter(id__in=successful_route_ids)
-
         # if there are none return None
-        if len(successful_routes) == 0:
+        if not successful_route_ids:
             continue
         else:
-            exact_routes = successful_routes.filter(
+            exact_routes = Route.objects.filter(
+                id__in=successful_route_ids,
                 start_lat=start_lat,
                 start_lon=start_lon,
                 end_lat=end_lat,
                 end_lon=end_lon,
-            )
+            ).only(*ROUTE_COORDINATE_FIELDS)
 
             if len(exact_routes) == 1:
-                return exact_routes[0]
+                return Route.objects.get(id=exact_routes[0].id)
             elif len(exact_routes) > 1:
                 # TODO if multiple matching routes exist, which to return?
-                return exact_routes[0]
+                return Route.objects.get(id=exact_routes[0].id)
             else:
                 # if no exact routes, look for any that are close enough
                 return _closest_route_in_tolerance(
@@ -116,57 +142,83 @@ def _closest_route_in_tolerance(
 ) -> Union[Route, None]:
     """Takes a list of routes and returns the closest if any are within tolerance, or None."""
 
-    def point_within_tolerance(point_1: tuple, point_2: tuple) -> bool:
-        return haversine_distance(point_1, point_2) < tolerance_nm
-
-    def haversine_distance(point_1: tuple, point_2: tuple) -> float:
-        return haversine.haversine(point_1, point_2, unit=haversine.Unit.NAUTICAL_MILES)
-
-    routes_in_tolerance = []
-    for route in routes:
-        if point_within_tolerance(
-            (start_lat, start_lon), (route.start_lat, route.start_lon)
-        ) and point_within_tolerance(
-            (end_lat, end_lon), (route.end_lat, route.end_lon)
-        ):
-            routes_in_tolerance.append(
-                {
-                    "id": route.id,
-                }
-            )
-
-    if len(routes_in_tolerance) == 0:
+    if len(routes) == 0:
         return None
-    elif len(routes_in_tolerance) == 1:
-        return Route.objects.get(id=routes_in_tolerance[0]["id"])
-    else:
-        for i, route_dict in enumerate(routes_in_tolerance):
-            route = Route.objects.get(id=route_dict["id"])
-            routes_in_tolerance[i].update(
-                {
-                    "cumulative_distance": haversine_distance(
-                        (start_lat, start_lon), (route.start_lat, route.start_lon)
-                    )
-                    + haversine_distance(
-                        (end_lat, end_lon), (route.end_lat, route.end_lon)
-                    )
-                }
-            )
-
-        from operator import itemgetter
-
-        closest_route = sorted(
-            routes_in_tolerance, key=itemgetter("cumulative_distance")
-        )[0]
-        return Route.objects.get(id=closest_route["id"])
+
+    # hold candidate waypoints as one contiguous array per coordinate
+    def column(field: str) -> np.ndarray:
+        return np.fromiter(
+            (getattr(route, field) for route in routes), dtype=float, count=len(routes)
+        )
+
+    route_ids = np.fromiter(
+        (route.id for route in routes), dtype=np.int64, count=len(routes)
+    )
+    start_distances = _haversine_distance_nm(
+        start_lat, start_lon, column("start_lat"), column("start_lon")
+    )
+    end_distances = _haversine_distance_nm(
+        end_lat, end_lon, column("end_lat"), column("end_lon")
+    )
+
+    in_tolerance = (start_distances < tolerance_nm) & (end_distances < tolerance_nm)
+    if not in_tolerance.any():
+        return None
+
+    # closest by summed distance of start and end points, first route wins a tie
+    cumulative_distances = np.where(
+        in_tolerance, start_distances + end_distances, np.inf
+    )
+    return Route.objects.get(id=int(route_ids[np.argmin(cumulative_distances)]))
+
+
+def _haversine_distance_nm(
+    lat_1: float, lon_1: float, lat_2: np.ndarray, lon_2: np.ndarray
+) -> np.ndarray:
+    """Great circle distances in nautical miles from one point to arrays of points.
+    Uses the same formula and earth radius as haversine.haversine."""
+
+    lat_1, lon_1, lat_2, lon_2 = (np.radians(x) for x in (lat_1, lon_1, lat_2, lon_2))
+    d = (
+        np.sin((lat_2 - lat_1) * 0.5) ** 2
+        + np.cos(lat_1) * np.cos(lat_2) * np.sin((lon_2 - lon_1) * 0.5) ** 2
+    )
+    return (
+        2 * get_avg_earth_radius(haversine.Unit.NAUTICAL_MILES) * np.arcsin(np.sqrt(d))
+    )
+
+
+def validate_vessel_config(config: dict) -> None:
+    """Validate a vessel config against the PolarRoute vessel schema.
+    Like polar_route's validate_vessel_config, but reusing one validator and
+    only accepting the config itself, never a path to a config file.
+
+    Args:
+        config (dict): vessel config.
+
+    Raises:
+        TypeError: config is not a dict.
+        jsonschema.exceptions.ValidationError: config does not match the schema.
+    """
+
+    if not isinstance(config, dict):
+        raise TypeError(f"Expected 'dict', instead got '{type(config).__name__}'")
+
+    error = best_match(_VESSEL_SCHEMA_VALIDATOR.iter_errors(config))
+    if error is not None:
+        raise error
 
 
 def calculate_md5(filename):
     """create md5sum checksum for any file"""
-    hash_md5 = hashlib.md5()
 
     with open(filename, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
+        # python >= 3.11 hashes the file without copying each chunk into python
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, "md5").hexdigest()
+
+        hash_md5 = hashlib.md5()
+        for chunk in iter(lambda: f.read(2**16), b""):
             hash_md5.update(chunk)
     return hash_md5.hexdigest()
 
@@ -231,7 +283,8 @@ def select_mesh_for_route_evaluation(route: dict) -> Union[list[Mesh], None]:
     lats = [c[0] for c in coordinates]
     lons = [c[1] for c in coordinates]
 
-    return select_mesh(min(lats), min(lons), max(lats), max(lons))
+    # only the first mesh is used for evaluation
+    return select_mesh(min(lats), min(lons), max(lats), max(lons), limit=1)
 
 
 def check_mesh_data(mesh: Mesh) -> str:
@@ -17,7 +17,6 @@ from rest_framework.reverse import reverse
 from rest_framework import serializers, viewsets
 from taggit.models import TaggedItem
 
-from polar_route.config_validation.config_validator import validate_vessel_config
 from polarrouteserver._version import __version__ as polarrouteserver_version
 from polarrouteserver.celery import app
 
@@ -51,6 +50,7 @@ from .utils import (
     route_exists,
     select_mesh,
     select_mesh_for_route_evaluation,
+    validate_vessel_config,
 )
 
 logger = logging.getLogger(__name__)
@@ -120,7 +120,7 @@ class VehicleRequestView(LoggingMixin, ResponseMixin, GenericAPIView):
 
         data = request.data
 
-        # Using Polarroute's built in validation to validate vessel config supplied
+        # Validate the vessel config supplied against PolarRoute's vessel schema
         try:
             validate_vessel_config(data)
             logging.info("Vessel config is valid.")
@@ -477,7 +477,8 @@ class RouteDetailView(LoggingMixin, ResponseMixin, GenericAPIView):
         )
 
         try:
-            route = Route.objects.get(id=id)
+            # the serializer only needs mesh metadata, not the mesh itself
+            route = Route.objects.select_related("mesh").defer("mesh__json").get(id=id)
         except Route.DoesNotExist:
             return self.not_found_response(f"Route with id {id} not found.")
 
@@ -522,7 +523,7 @@ class RecentRoutesView(LoggingMixin, ResponseMixin, GenericAPIView):
         # Only get today's routes
         routes_recent = (
             Route.objects.filter(requested__gte=timezone.now() - timedelta(hours=24))
-            .select_related("job")
+            # values() joins the job and mesh columns into this single query
             .values(
                 "id",
                 "start_lat",
@@ -1,4 +1,5 @@
 from pathlib import Path
+import tempfile
 
 from .base import *
 
@@ -10,7 +11,12 @@ MESH_DIR = Path("tests", "fixtures")
 MESH_METADATA_DIR = MESH_DIR
 
 CELERY_BROKER_URL = "memory://"
-CELERY_RESULT_BACKEND = "db+sqlite:///results.sqlite"
+# eager task results are kept in the temp directory so test runs leave nothing in the tree,
+# with a separate file per pytest-xdist worker so workers don't lock each other out
+_XDIST_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+CELERY_RESULT_BACKEND = "db+sqlite:///" + str(
+    Path(tempfile.gettempdir(), f"polarrouteserver_test_results_{_XDIST_WORKER}.sqlite")
+)
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_STORE_EAGER_RESULT = True
 CELERY_TASK_EAGER_PROPAGATES = True
@@ -19,5 +25,8 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": os.path.join(BASE_DIR, "db.sqlite3"),
+        # run tests against an in-memory database, nothing is written to disk
+        # (one per xdist worker, so TransactionTestCase flushes don't clash)
+        "TEST": {"NAME": ":memory:"},
     }
 }
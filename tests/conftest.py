@@ -0,0 +1,14 @@
+import pytest
+
+from .utils import add_test_mesh_to_db
+
+
+@pytest.fixture
+def test_mesh(db):
+    """The test mesh, added to the database for a single test.
+
+    Function scoped because each test's database changes are rolled back
+    (or flushed, for TransactionTestCase) once it finishes; the mesh file
+    itself is only read once per session, see add_test_mesh_to_db.
+    """
+    return add_test_mesh_to_db()
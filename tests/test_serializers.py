@@ -13,14 +13,14 @@ from polarrouteserver.route_api.serializers import (
     VehicleSerializer,
 )
 
+_FACTORY = RequestFactory()
+
 
 class TestRouteSerializer(TestCase):
     """Test the RouteSerializer with various route data scenarios."""
 
     def setUp(self):
         """Set up test data."""
-        self.factory = RequestFactory()
-        
         # Create test mesh
         self.mesh = Mesh.objects.create(
             meshiphi_version="1.0",
@@ -313,8 +313,6 @@ class TestJobStatusSerializer(TestCase):
 
     def setUp(self):
         """Set up test data."""
-        self.factory = RequestFactory()
-        
         self.mesh = Mesh.objects.create(
             meshiphi_version="1.0",
             md5="test_hash",
@@ -350,7 +348,7 @@ class TestJobStatusSerializer(TestCase):
         mock_result.state = "SUCCESS"
         mock_async_result.return_value = mock_result
 
-        request = self.factory.get('/api/job/')
+        request = _FACTORY.get('/api/job/')
         serializer = JobStatusSerializer(job, context={'request': request})
         data = serializer.data
 
@@ -2,14 +2,14 @@ from datetime import datetime, timedelta, timezone
 import gzip
 import hashlib
 import json
-import os
 from pathlib import Path
 import shutil
+import tempfile
 import warnings
 
 from celery.exceptions import Ignore
 from django.conf import settings
-from django.test import TestCase, TransactionTestCase
+from django.test import TestCase, TransactionTestCase, override_settings
 import pytest
 import yaml
 
@@ -47,13 +47,9 @@ class TestOptimiseRoute(TestCase):
 
     def test_out_of_mesh_error(self):
         """Test that out of mesh locations causes error to be returned"""
-        with open(settings.TEST_MESH_PATH) as f:
-            mesh = json.load(f)
-        
-        lat_min = mesh["config"]["mesh_info"]["region"]["lat_min"]
-        lat_max = mesh["config"]["mesh_info"]["region"]["lat_max"]
-        lon_min = mesh["config"]["mesh_info"]["region"]["long_min"]
-        lon_max = mesh["config"]["mesh_info"]["region"]["long_max"]
+        # the mesh bounds are stored from the mesh file's region
+        lat_min, lat_max = self.mesh.lat_min, self.mesh.lat_max
+        lon_min, lon_max = self.mesh.lon_min, self.mesh.lon_max
 
         self.out_of_mesh_route = Route.objects.create(
             start_lat=lat_min-5, start_lon=lon_min-5,
@@ -99,13 +95,9 @@ class TestTaskStatus(TransactionTestCase):
 
     def test_out_of_mesh_error_causes_task_failure(self):
         """Check that an example error (out of mesh) results in the task status being updated correctly."""
-        with open(settings.TEST_MESH_PATH) as f:
-            mesh = json.load(f)
-        
-        lat_min = mesh["config"]["mesh_info"]["region"]["lat_min"]
-        lat_max = mesh["config"]["mesh_info"]["region"]["lat_max"]
-        lon_min = mesh["config"]["mesh_info"]["region"]["long_min"]
-        lon_max = mesh["config"]["mesh_info"]["region"]["long_max"]
+        # the mesh bounds are stored from the mesh file's region
+        lat_min, lat_max = self.mesh.lat_min, self.mesh.lat_max
+        lon_min, lon_max = self.mesh.lon_min, self.mesh.lon_max
 
         self.out_of_mesh_route = Route.objects.create(
             start_lat=lat_min-5, start_lon=lon_min-5,
@@ -121,6 +113,15 @@ class TestImportNewMeshes(TestCase):
 
     def setUp(self):
 
+        # write test files to a directory of their own, so parallel test runs don't collide
+        mesh_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(mesh_dir.cleanup)
+        mesh_dir_settings = override_settings(
+            MESH_DIR=Path(mesh_dir.name), MESH_METADATA_DIR=Path(mesh_dir.name)
+        )
+        mesh_dir_settings.enable()
+        self.addCleanup(mesh_dir_settings.disable)
+
         self.metadata_filename = "upload_metadata_test.yaml"
         self.metadata_filepath = Path(settings.MESH_DIR, self.metadata_filename)
 
@@ -202,13 +203,6 @@ class TestImportNewMeshes(TestCase):
                 shutil.copyfileobj(f_in, f_out)
 
 
-    def tearDown(self):
-        # cleanup files created for testing
-        for filename in self.mesh_filenames + [self.metadata_filename]:
-            os.remove(Path(settings.MESH_DIR, filename))
-            os.remove(Path(settings.MESH_DIR, filename+".gz"))
-        
-
     def test_import_new_meshes(self):
         
         with warnings.catch_warnings():
@@ -1,6 +1,6 @@
+import copy
 import datetime
 import hashlib
-import json
 from unittest.mock import patch, PropertyMock
 import uuid
 
@@ -12,11 +12,18 @@ from haversine import inverse_haversine, Unit, Direction
 import pytest
 
 from polarrouteserver.route_api.models import Mesh, Job, Route
-from polarrouteserver.route_api.utils import evaluate_route, route_exists, select_mesh, select_mesh_for_route_evaluation
-
-from polarrouteserver.route_api.models import Mesh, Route
-from polarrouteserver.route_api.utils import check_mesh_data, route_exists, select_mesh
-from .utils import add_test_mesh_to_db
+from polarrouteserver.route_api.utils import (
+    check_mesh_data,
+    evaluate_route,
+    route_exists,
+    select_mesh,
+    select_mesh_for_route_evaluation,
+)
+from .utils import add_test_mesh_to_db, load_json
+
+_ROUTE_JSON = load_json(settings.TEST_ROUTE_PATH)
+# meshes created directly in tests only need a well-formed md5
+_DUMMY_MD5 = hashlib.md5("dummy_hashable_string".encode('utf-8')).hexdigest()
 
 class TestRouteExists(TestCase):
     "Test function for checking for existing routes"
@@ -40,7 +47,7 @@ class TestRouteExists(TestCase):
             mesh=self.mesh
         )
 
-        self.job = Job.objects.create(id=uuid.uuid1(),route=self.route)
+        self.job = Job.objects.create(id=uuid.uuid4(),route=self.route)
 
     def test_route_exists(self):
         "Test case where exact requested route exists"
@@ -48,14 +55,16 @@ class TestRouteExists(TestCase):
             "polarrouteserver.route_api.views.AsyncResult.state", new_callable=PropertyMock
         ) as mock_job_status:
             mock_job_status.return_value = celery.states.SUCCESS
-        
-            route = route_exists(
-                self.mesh,
-                start_lat=self.start_lat,
-                start_lon=self.start_lon,
-                end_lat=self.end_lat,
-                end_lon=self.end_lon,
-            )
+
+            # routes, all of their jobs, the exact match, then the full route
+            with self.assertNumQueries(4):
+                route = route_exists(
+                    self.mesh,
+                    start_lat=self.start_lat,
+                    start_lon=self.start_lon,
+                    end_lat=self.end_lat,
+                    end_lon=self.end_lon,
+                )
         assert route == self.route
 
     def test_failed_route_exists(self):
@@ -118,7 +127,7 @@ class TestRouteExists(TestCase):
             mesh=self.mesh
         )
 
-        Job.objects.create(id=uuid.uuid1(), route=nearby_route)
+        Job.objects.create(id=uuid.uuid4(), route=nearby_route)
 
         with patch(
             "polarrouteserver.route_api.views.AsyncResult.state", new_callable=PropertyMock
@@ -161,7 +170,7 @@ class TestRouteExists(TestCase):
             mesh=self.mesh
         )
 
-        Job.objects.create(id=uuid.uuid1(), route=closest_route)
+        Job.objects.create(id=uuid.uuid4(), route=closest_route)
 
         with patch(
             "polarrouteserver.route_api.views.AsyncResult.state", new_callable=PropertyMock
@@ -185,7 +194,7 @@ class TestSelectMesh(TestCase):
 
         self.southern_mesh = Mesh.objects.create(
             name = "southern_test_mesh.vessel.json",
-            md5 = hashlib.md5("dummy_hashable_string".encode('utf-8')).hexdigest(),
+            md5 = _DUMMY_MD5,
             meshiphi_version = "2.1.13",
             valid_date_start = timezone.now().date() - datetime.timedelta(days=3),
             valid_date_end = timezone.now().date(),
@@ -213,31 +222,32 @@ class TestSelectMesh(TestCase):
         ) == None
 
     def test_smallest_mesh(self):
-        self.smallest_mesh = Mesh.objects.create(
-            name = "smallest_test_mesh.vessel.json",
-            md5 = hashlib.md5("dummy_hashable_string".encode('utf-8')).hexdigest(),
-            meshiphi_version = "2.1.13",
-            valid_date_start = timezone.now().date() - datetime.timedelta(days=3),
-            valid_date_end = timezone.now().date(),
-            created = datetime.datetime.now(datetime.timezone.utc),
-            lat_min =  -80.0,
-            lat_max =  -56.0,
-            lon_min = -115.0,
-            lon_max =    0.0,
-        )
-
-        self.smaller_mesh = Mesh.objects.create(
-            name = "smaller_test_mesh.vessel.json",
-            md5 = hashlib.md5("dummy_hashable_string".encode('utf-8')).hexdigest(),
-            meshiphi_version = "2.1.13",
-            valid_date_start = timezone.now().date() - datetime.timedelta(days=3),
-            valid_date_end = timezone.now().date(),
-            created = datetime.datetime.now(datetime.timezone.utc),
-            lat_min =  -85.0,
-            lat_max =  -60.0,
-            lon_min = -117.0,
-            lon_max =    0.0,
-        )
+        self.smallest_mesh, self.smaller_mesh = Mesh.objects.bulk_create([
+            Mesh(
+                name = "smallest_test_mesh.vessel.json",
+                md5 = _DUMMY_MD5,
+                meshiphi_version = "2.1.13",
+                valid_date_start = timezone.now().date() - datetime.timedelta(days=3),
+                valid_date_end = timezone.now().date(),
+                created = datetime.datetime.now(datetime.timezone.utc),
+                lat_min =  -80.0,
+                lat_max =  -56.0,
+                lon_min = -115.0,
+                lon_max =    0.0,
+            ),
+            Mesh(
+                name = "smaller_test_mesh.vessel.json",
+                md5 = _DUMMY_MD5,
+                meshiphi_version = "2.1.13",
+                valid_date_start = timezone.now().date() - datetime.timedelta(days=3),
+                valid_date_end = timezone.now().date(),
+                created = datetime.datetime.now(datetime.timezone.utc),
+                lat_min =  -85.0,
+                lat_max =  -60.0,
+                lon_min = -117.0,
+                lon_max =    0.0,
+            ),
+        ])
 
         # check that we've actually made a smaller mesh
         assert self.smaller_mesh.size < self.southern_mesh.size
@@ -250,21 +260,26 @@ class TestSelectMesh(TestCase):
             end_lon   = -110
         ) == [self.smallest_mesh, self.smaller_mesh, self.southern_mesh]
 
+        # test that limit returns only the smallest meshes
+        assert select_mesh(
+            start_lat = -60,
+            start_lon = -55,
+            end_lat   = -80,
+            end_lon   = -110,
+            limit     = 1,
+        ) == [self.smallest_mesh]
+
     def test_select_mesh_for_route_evaluation(self):
 
         self.mesh_for_evaluation = add_test_mesh_to_db()
 
-        with open(settings.TEST_ROUTE_PATH) as fp:
-            self.route_json = json.load(fp)
-
-        assert select_mesh_for_route_evaluation(self.route_json) == [self.mesh_for_evaluation]
+        assert select_mesh_for_route_evaluation(_ROUTE_JSON) == [self.mesh_for_evaluation]
 
 @pytest.mark.django_db
+@pytest.mark.usefixtures("test_mesh")
 def test_evaluate_route():
-    add_test_mesh_to_db()
-
-    with open(settings.TEST_ROUTE_PATH) as fp:
-        route_json = json.load(fp)
+    # evaluate_route may fill in missing properties, so don't hand it the shared copy
+    route_json = copy.deepcopy(_ROUTE_JSON)
 
     mesh = select_mesh_for_route_evaluation(route_json)
 
@@ -1,11 +1,13 @@
-import json
 import uuid
 from datetime import timedelta
-from unittest.mock import patch, PropertyMock
+from functools import lru_cache
+from types import MappingProxyType
+from unittest.mock import Mock, patch, PropertyMock
 
 import celery.states
 from django.conf import settings
-from django.test import TestCase
+from django.contrib.contenttypes.models import ContentType
+from django.test import SimpleTestCase, TestCase
 from django.utils import timezone
 from rest_framework.test import APIRequestFactory
 import pytest
@@ -22,56 +24,60 @@ from polarrouteserver.route_api.views import (
     LocationViewSet,
     JobView,
 )
-from polarrouteserver.route_api.models import Job, Route
-from polarrouteserver.route_api.tasks import optimise_route
-from .utils import add_test_mesh_to_db
+from polarrouteserver.route_api.models import Job, Route, Vehicle
+from .utils import add_test_mesh_to_db, dump_json, load_json
 
+# requests are serialised by the factory, so views never modify these
+_ROUTE_JSON = load_json(settings.TEST_ROUTE_PATH)
+_ROUTE_OOM_JSON = load_json(settings.TEST_ROUTE_OOM_PATH)
+# routes (joined with job and mesh) and their tags, whatever the number of routes
+_RECENT_ROUTES_NUM_QUERIES = 2
+# the request factory keeps no per-request state, so one instance serves every test
+_FACTORY = APIRequestFactory()
+# views built once, as_view() returns a function creating a new view instance per request
+_VEHICLE_REQUEST_VIEW = VehicleRequestView.as_view()
+_VEHICLE_DETAIL_VIEW = VehicleDetailView.as_view()
+_JOB_VIEW = JobView.as_view()
 
-class TestVehicleRequest(TestCase):
-    """
-    Test case for the Vehicle API endpoints. Covers:
-    - Creating and updating vehicles
-    - Validating input data for vehicles
-    - Retrieving vehicle records
-    - Deleting vehicle records
-    """
 
-    with open(settings.TEST_VEHICLE_PATH) as fp:
-        vessel_config = json.load(fp)
+@lru_cache(maxsize=1)
+def _vessel_config():
+    """The test vessel config, read on first use. Read-only, tests take a copy to modify."""
+    return MappingProxyType(load_json(settings.TEST_VEHICLE_PATH))
 
-    data = dict(vessel_config)
 
-    def setUp(self):
-        """
-        Set up test environment for each test case, API request factory and test data.
-        """
-        self.factory = APIRequestFactory()
-        self.data = self.__class__.data.copy()
+def _post_vehicle(data):
+    """
+    Send a POST request to create or update a vehicle.
 
-    def post_vehicle(self, data):
-        """
-        Helper method to send a POST request to create or update a vehicle.
+    Args:
+        data (dict): The vehicle data payload.
 
-        Args:
-            data (dict): The vehicle data payload.
+    Returns:
+        Response: Response object returned.
+    """
+    request = _FACTORY.post(
+        "/api/vehicle", data=dump_json(data), content_type="application/json"
+    )
+    return _VEHICLE_REQUEST_VIEW(request)
 
-        Returns:
-            Response: Response object returned.
-        """
-        request = self.factory.post(
-            "/api/vehicle", data=data, format="json"
-        )
-        return VehicleRequestView.as_view()(request)
+
+class TestVehicleRequest(TestCase):
+    """
+    Test case for the Vehicle API endpoints. Covers:
+    - Creating and updating vehicles
+    - Deleting non-existent vehicle records
+    """
 
     def test_create_update_vehicle(self):
         """
         Test creating a new vehicle, handling duplicates, and using force_properties.
         """
-        data = self.data.copy()
-        response = self.post_vehicle(data)
+        data = dict(_vessel_config())
+        response = _post_vehicle(data)
         self.assertEqual(response.status_code, 200)
 
-        duplicate_response = self.post_vehicle(data)
+        duplicate_response = _post_vehicle(data)
         self.assertEqual(duplicate_response.status_code, 406)
         self.assertIn("error", duplicate_response.data)
         self.assertIn(
@@ -79,72 +85,56 @@ class TestVehicleRequest(TestCase):
         )
 
         data.update({"force_properties": True})
-        response_force = self.post_vehicle(data)
+        response_force = _post_vehicle(data)
         self.assertEqual(response_force.status_code, 200)
         self.assertEqual(
             response.data.get("vessel_type"),
             response_force.data.get("vessel_type"),
         )
 
-    def test_missing_property(self):
+    def test_delete_vehicle_not_found(self):
         """
-        Test that omitting a required property (e.g., 'max_speed') results in validation error.
+        Test deletion of a non-existent vehicle.
         """
-        missing_property = self.data.copy()
-        missing_property.pop("max_speed", None)
-        response = self.post_vehicle(missing_property)
-
-        self.assertEqual(response.status_code, 400)
-        self.assertIn("error", response.data)
-        self.assertIn(
-            "Validation error: 'max_speed' is a required property",
-            response.data["error"],
+        vessel_type = "non_existent_type"
+        request_delete = _FACTORY.delete(f"/api/vehicle/{vessel_type}/")
+        response_delete = _VEHICLE_DETAIL_VIEW(
+            request_delete, vessel_type=vessel_type
         )
 
-    def test_wrong_type(self, data=data):
-        """
-        Test that submitting a wrong data type (e.g., string for 'max_speed') fails.
-        """
-        wrong_type = self.data.copy()
-        wrong_type["max_speed"] = "really fast"
-        response = self.post_vehicle(wrong_type)
+        self.assertEqual(response_delete.status_code, 404)
+        self.assertIn("error", response_delete.data)
+        self.assertIn(vessel_type, response_delete.data["error"])
 
-        self.assertEqual(response.status_code, 400)
-        self.assertIn("error", response.data)
-        self.assertIn(
-            "Validation error: 'really fast' is not of type 'number'",
-            response.data["error"],
-        )
 
-    def test_type_error_on_invalid_input(self):
-        """
-        Test that submitting a non-dictionary returns a validation error.
-        """
-        invalid_data = ["this", "is", "not", "a", "dict"]
-        response = self.post_vehicle(invalid_data)
+class TestExistingVehicle(TestCase):
+    """
+    Test case for the Vehicle API endpoints acting on an existing vehicle. Covers:
+    - Retrieving vehicle records
+    - Deleting vehicle records
+    """
 
-        self.assertEqual(response.status_code, 400)
-        self.assertIn("error", response.data)
-        self.assertIn("Expected 'str' or 'dict'", response.data["error"])
+    @classmethod
+    def setUpTestData(cls):
+        # created directly, creating vehicles through the API is tested in TestVehicleRequest
+        cls.vehicle = Vehicle.objects.create(**_vessel_config())
 
     def test_get_vehicle(self):
         """
         Test GET requests to fetch specific or all vehicles.
         """
-        self.post_vehicle(self.data)
-
         # Test GET all vehicles
-        request_all = self.factory.get("/api/vehicle")
-        response_all = VehicleRequestView.as_view()(request_all)
+        request_all = _FACTORY.get("/api/vehicle")
+        response_all = _VEHICLE_REQUEST_VIEW(request_all)
 
         self.assertEqual(response_all.status_code, 200)
         self.assertTrue(len(response_all.data) >= 1)
         self.assertIn("vessel_type", response_all.data[0])
 
         # Test GET specific vehicle
-        vessel_type = self.data["vessel_type"]
-        request_specific = self.factory.get(f"/api/vehicle/{vessel_type}/")
-        response_specific = VehicleDetailView.as_view()(
+        vessel_type = self.vehicle.vessel_type
+        request_specific = _FACTORY.get(f"/api/vehicle/{vessel_type}/")
+        response_specific = _VEHICLE_DETAIL_VIEW(
             request_specific, vessel_type=vessel_type
         )
 
@@ -158,131 +148,116 @@ class TestVehicleRequest(TestCase):
         """
         Test successful deletion of a vehicle.
         """
-        self.post_vehicle(self.data)
-        vessel_type = self.data["vessel_type"]
+        vessel_type = self.vehicle.vessel_type
 
-        request_delete = self.factory.delete(f"/api/vehicle/{vessel_type}/")
-        response_delete = VehicleDetailView.as_view()(
+        request_delete = _FACTORY.delete(f"/api/vehicle/{vessel_type}/")
+        response_delete = _VEHICLE_DETAIL_VIEW(
             request_delete, vessel_type=vessel_type
         )
 
         self.assertEqual(response_delete.status_code, 204)
         self.assertIn("message", response_delete.data)
 
-    def test_delete_vehicle_without_vessel_type(self):
-        """
-        Test deletion attempt without specifying a 'vessel_type' fails.
-        We have intentionally not implemented this method.
-        """
-        request_delete = self.factory.delete("/api/vehicle/")
-        response_delete = VehicleRequestView.as_view()(
-            request_delete
-        )
-
-        self.assertEqual(response_delete.status_code, 405)
-
-    def test_delete_vehicle_not_found(self):
-        """
-        Test deletion of a non-existent vehicle.
-        """
-        vessel_type = "non_existent_type"
-        request_delete = self.factory.delete(f"/api/vehicle/{vessel_type}/")
-        response_delete = VehicleDetailView.as_view()(
-            request_delete, vessel_type=vessel_type
-        )
-
-        self.assertEqual(response_delete.status_code, 404)
-        self.assertIn("error", response_delete.data)
-        self.assertIn(vessel_type, response_delete.data["error"])
-
 
-class TestVehicleTypeListView(TestCase):
+class TestVehicleRequestValidation(SimpleTestCase):
     """
-    Test case for the VehicleTypeListView endpoint at /api/vehicle/available, listing all available
-    vehicles.
+    Test case for Vehicle API requests which are rejected before reaching the database. Covers:
+    - Validating input data for vehicles
+    - Unsupported methods
     """
 
-    with open(settings.TEST_VEHICLE_PATH) as fp:
-        vessel_config = json.load(fp)
-
-    data = dict(vessel_config)
-
-    def setUp(self):
-        """
-        Set up test environment for each test case, API request factory and test data.
+    def test_missing_property(self):
         """
-        self.factory = APIRequestFactory()
-        self.data = self.__class__.data.copy()
-
-    def post_vehicle(self, data):
+        Test that omitting a required property (e.g., 'max_speed') results in validation error.
         """
-        Helper method to send a POST request to create or update a vehicle.
+        missing_property = dict(_vessel_config())
+        missing_property.pop("max_speed", None)
+        response = _post_vehicle(missing_property)
 
-        Args:
-            data (dict): The vehicle data.
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("error", response.data)
+        self.assertIn(
+            "Validation error: 'max_speed' is a required property",
+            response.data["error"],
+        )
 
-        Returns:
-            Response: Response object returned.
+    def test_wrong_type(self):
+        """
+        Test that submitting a wrong data type (e.g., string for 'max_speed') fails.
         """
-        request = self.factory.post(
-            "/api/vehicle", data=data, format="json"
+        wrong_type = dict(_vessel_config())
+        wrong_type["max_speed"] = "really fast"
+        response = _post_vehicle(wrong_type)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("error", response.data)
+        self.assertIn(
+            "Validation error: 'really fast' is not of type 'number'",
+            response.data["error"],
         )
-        return VehicleRequestView.as_view()(request)
 
-    def test_get_vessel_types_empty(self):
+    def test_type_error_on_invalid_input(self):
         """
-        Test the endpoint returns 200 OK with empty array when no vehicles exist.
+        Test that submitting a non-dictionary returns a validation error.
         """
-        request = self.factory.get("/api/vehicle/available")
-        response = VehicleTypeListView.as_view()(request)
+        invalid_data = ["this", "is", "not", "a", "dict"]
+        response = _post_vehicle(invalid_data)
 
-        self.assertEqual(response.status_code, 200)
-        self.assertIn("vessel_types", response.data)
-        self.assertEqual(response.data["vessel_types"], [])
-        self.assertIn("message", response.data)
-        self.assertEqual(response.data["message"], "No available vessel types found.")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("error", response.data)
+        self.assertIn("Expected 'dict', instead got 'list'", response.data["error"])
 
-    def test_get_vessel_types_single_vehicle(self):
+    def test_type_error_on_string_input(self):
         """
-        Test the endpoint after creating a single vehicle.
+        Test that a JSON string body is rejected, not treated as a path to a vessel config file.
         """
-        self.post_vehicle(self.data)
-
-        request = self.factory.get("/api/vehicle/available")
-        response = VehicleTypeListView.as_view()(request)
+        response = _post_vehicle(str(settings.TEST_VEHICLE_PATH))
 
-        self.assertEqual(response.status_code, 200)
-        self.assertIn("vessel_types", response.data)
-        self.assertEqual(len(response.data["vessel_types"]), 1)
-        self.assertIn(self.data["vessel_type"], response.data["vessel_types"])
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("error", response.data)
+        self.assertIn("Expected 'dict', instead got 'str'", response.data["error"])
 
-    def test_get_vessel_types_multiple_vehicles(self):
+    def test_delete_vehicle_without_vessel_type(self):
         """
-        Test the endpoint after creating vehicles with multiple distinct vessel_types.
+        Test deletion attempt without specifying a 'vessel_type' fails.
+        We have intentionally not implemented this method.
         """
-        data1 = self.data.copy()
-        data2 = self.data.copy()
-        data2["vessel_type"] = "Boaty McBoatface"
+        request_delete = _FACTORY.delete("/api/vehicle/")
+        response_delete = _VEHICLE_REQUEST_VIEW(
+            request_delete
+        )
+
+        self.assertEqual(response_delete.status_code, 405)
+
 
-        self.post_vehicle(data1)
-        self.post_vehicle(data2)
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "num_vehicles", [0, 1, 2], ids=["empty", "single_vehicle", "multiple_vehicles"]
+)
+def test_get_vessel_types(num_vehicles, django_assert_max_num_queries):
+    """
+    Test the VehicleTypeListView endpoint at /api/vehicle/available lists the distinct
+    vessel_types of all available vehicles, in a single query.
+    """
+    vessel_types = [_vessel_config()["vessel_type"], "Boaty McBoatface"][:num_vehicles]
+    Vehicle.objects.bulk_create(
+        [Vehicle(**dict(_vessel_config(), vessel_type=v)) for v in vessel_types]
+    )
 
-        request = self.factory.get("/api/vehicle/available")
+    request = _FACTORY.get("/api/vehicle/available")
+    with django_assert_max_num_queries(1):
         response = VehicleTypeListView.as_view()(request)
 
-        self.assertEqual(response.status_code, 200)
-        self.assertIn("vessel_types", response.data)
-        self.assertEqual(len(response.data["vessel_types"]), 2)
-        self.assertCountEqual(
-            response.data["vessel_types"],
-            [data1["vessel_type"], data2["vessel_type"]],
-        )
+    assert response.status_code == 200
+    assert sorted(response.data["vessel_types"]) == sorted(vessel_types)
+    if not vessel_types:
+        assert response.data["message"] == "No available vessel types found."
 
 
 class TestRouteRequest(TestCase):
-    def setUp(self):
-        add_test_mesh_to_db()
-        self.factory = APIRequestFactory()
+    @classmethod
+    def setUpTestData(cls):
+        cls.mesh = add_test_mesh_to_db()
 
     def test_custom_mesh_id(self):
         """Test that non-existent mesh id results in correct error message."""
@@ -295,7 +270,7 @@ class TestRouteRequest(TestCase):
             "mesh_id": 999,
         }
 
-        request = self.factory.post(
+        request = _FACTORY.post(
             "/api/route", data=data, format="json"
         )
 
@@ -312,7 +287,7 @@ class TestRouteRequest(TestCase):
             "end_lon": 1.0,
         }
 
-        request = self.factory.post(
+        request = _FACTORY.post(
             "/api/route", data=data, format="json"
         )
 
@@ -325,7 +300,7 @@ class TestRouteRequest(TestCase):
 
         # Test that requesting the same route doesn't start a new job.
         # request the same route parameters
-        request = self.factory.post(
+        request = _FACTORY.post(
             "/api/route", data=data, format="json"
         )
         response2 = RouteRequestView.as_view()(request) # Changed View
@@ -337,137 +312,10 @@ class TestRouteRequest(TestCase):
             "status-url"
         )
 
-    def test_request_route_with_tags(self):
-        """Test that routes can be created with optional tags."""
-        data = {
-            "start_lat": 0.1,
-            "start_lon": 0.1,
-            "end_lat": 0.9,
-            "end_lon": 0.9,
-            "start_name": "Test Start",
-            "end_name": "Test End",
-            "tags": ["archive_test"],
-        }
-
-        request = self.factory.post(
-            "/api/route", data=data, format="json"
-        )
-
-        response = RouteRequestView.as_view()(request)
-
-        self.assertEqual(response.status_code, 202)
-
-        # Verify the route was created with the correct tag
-        from polarrouteserver.route_api.models import Route
-        route = Route.objects.filter(
-            start_lat=0.1,
-            start_lon=0.1,
-            end_lat=0.9,
-            end_lon=0.9
-        ).first()
-
-        self.assertIsNotNone(route)
-        self.assertIn("archive_test", [tag.name for tag in route.tags.all()])
-
-    def test_request_route_without_tags(self):
-        """Test that routes can be created without tags (tag is optional)."""
-        data = {
-            "start_lat": 0.2,
-            "start_lon": 0.2,
-            "end_lat": 0.8,
-            "end_lon": 0.8,
-        }
-
-        request = self.factory.post(
-            "/api/route", data=data, format="json"
-        )
-
-        response = RouteRequestView.as_view()(request)
-
-        self.assertEqual(response.status_code, 202)
-
-        # Verify the route was created without any tags
-        from polarrouteserver.route_api.models import Route
-        route = Route.objects.filter(
-            start_lat=0.2,
-            start_lon=0.2,
-            end_lat=0.8,
-            end_lon=0.8
-        ).first()
-
-        self.assertIsNotNone(route)
-        self.assertEqual(route.tags.count(), 0)
-
-    def test_request_route_with_comma_separated_tags(self):
-        """Test that routes can be created with comma-separated tag string."""
-        data = {
-            "start_lat": 0.3,
-            "start_lon": 0.3,
-            "end_lat": 0.7,
-            "end_lon": 0.7,
-            "tags": "archive,experiment, test_tag ",  # Test comma separation and whitespace
-        }
-
-        request = self.factory.post(
-            "/api/route", data=data, format="json"
-        )
-
-        response = RouteRequestView.as_view()(request)
-        self.assertEqual(response.status_code, 202)
-
-        # Verify the route was created with the correct tags
-        from polarrouteserver.route_api.models import Route
-        route = Route.objects.filter(
-            start_lat=0.3,
-            start_lon=0.3,
-            end_lat=0.7,
-            end_lon=0.7
-        ).first()
-
-        self.assertIsNotNone(route)
-        tag_names = [tag.name for tag in route.tags.all()]
-        self.assertIn("archive", tag_names)
-        self.assertIn("experiment", tag_names)
-        self.assertIn("test_tag", tag_names)
-        self.assertEqual(len(tag_names), 3)
-
-
-    def test_request_route_with_invalid_tags_type(self):
-        """Test that routes handle invalid tag types gracefully."""
-        data = {
-            "start_lat": 0.5,
-            "start_lon": 0.5,
-            "end_lat": 0.5,
-            "end_lon": 0.5,
-            "tags": {"invalid": "dict"},  # Invalid type should result in no tags
-        }
-
-        request = self.factory.post(
-            "/api/route", data=data, format="json"
-        )
-
-        response = RouteRequestView.as_view()(request)
-        self.assertEqual(response.status_code, 202)
-
-        # Verify the route was created without tags
-        from polarrouteserver.route_api.models import Route
-        route = Route.objects.filter(
-            start_lat=0.5,
-            start_lon=0.5,
-            end_lat=0.5,
-            end_lon=0.5
-        ).first()
-
-        self.assertIsNotNone(route)
-        self.assertEqual(route.tags.count(), 0)
-
     def test_evaluate_route(self):
-        with open(settings.TEST_ROUTE_PATH) as fp:
-            route_json = json.load(fp)
-
-        data = dict(route=route_json)
+        data = dict(route=_ROUTE_JSON)
 
-        request = self.factory.post(
+        request = _FACTORY.post(
             "/api/evaluate_route", data=data, format="json"
         )
 
@@ -475,12 +323,9 @@ class TestRouteRequest(TestCase):
         self.assertEqual(response.status_code, 200)
 
     def test_evaluate_out_of_mesh_waypoints(self):
-        with open(settings.TEST_ROUTE_OOM_PATH) as fp:
-            route_json = json.load(fp)
+        data = dict(route=_ROUTE_OOM_JSON)
 
-        data = dict(route=route_json)
-
-        request = self.factory.post(
+        request = _FACTORY.post(
             "/api/evaluate_route", data=data, format="json"
         )
 
@@ -488,43 +333,107 @@ class TestRouteRequest(TestCase):
         self.assertEqual(response.status_code, 404)
 
 
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "payload, expected_tags",
+    [
+        # tags are optional
+        ({"start_lat": 0.2, "start_lon": 0.2, "end_lat": 0.8, "end_lon": 0.8}, []),
+        (
+            {
+                "start_lat": 0.1,
+                "start_lon": 0.1,
+                "end_lat": 0.9,
+                "end_lon": 0.9,
+                "start_name": "Test Start",
+                "end_name": "Test End",
+                "tags": ["archive_test"],
+            },
+            ["archive_test"],
+        ),
+        # comma separated string with whitespace
+        (
+            {
+                "start_lat": 0.3,
+                "start_lon": 0.3,
+                "end_lat": 0.7,
+                "end_lon": 0.7,
+                "tags": "archive,experiment, test_tag ",
+            },
+            ["archive", "experiment", "test_tag"],
+        ),
+        # invalid type results in no tags
+        (
+            {
+                "start_lat": 0.5,
+                "start_lon": 0.5,
+                "end_lat": 0.5,
+                "end_lon": 0.5,
+                "tags": {"invalid": "dict"},
+            },
+            [],
+        ),
+    ],
+    ids=["without_tags", "with_tags", "comma_separated_tags", "invalid_tags_type"],
+)
+@pytest.mark.usefixtures("test_mesh")
+def test_request_route_tags(payload, expected_tags):
+    """Test that routes are created with the tags given in the request."""
+    request = _FACTORY.post("/api/route", data=payload, format="json")
+
+    # only the stored tags are checked, so don't run the route optimisation
+    with patch(
+        "polarrouteserver.route_api.views.optimise_route.delay",
+        side_effect=lambda *args, **kwargs: Mock(id=uuid.uuid4()),
+    ) as mock_delay:
+        response = RouteRequestView.as_view()(request)
+
+    mock_delay.assert_called_once()
+
+    assert response.status_code == 202
+
+    # the response id is the job id, look the route up through it
+    route = Route.objects.prefetch_related("tags").get(job__id=response.data["id"])
+
+    assert sorted(tag.name for tag in route.tags.all()) == sorted(expected_tags)
+
+
 pytestmark = pytest.mark.django_db
 
 
-@pytest.mark.usefixtures("celery_app", "celery_worker", "celery_enable_logging")
+@pytest.fixture
+def route(test_mesh):
+    """A route on the test mesh, for the job status and cancellation tests."""
+    return Route.objects.create(
+        start_lat=1.1, start_lon=1.1, end_lat=2.0, end_lon=2.0, mesh=test_mesh
+    )
+
+
 @pytest.mark.django_db
 class TestRouteStatus:
 
     pytestmark = pytest.mark.django_db
 
-    def setUp(self):
-        self.factory = APIRequestFactory()
-        mesh = add_test_mesh_to_db()
-        self.route = Route.objects.create(
-            start_lat=1.1, start_lon=1.1, end_lat=2.0, end_lon=2.0, mesh=mesh
-        )
-        optimise_route(self.route.id)
+    def test_get_status_pending(self, route):
 
-    def test_get_status_pending(self):
-        
-        self.setUp()
-        
         self.job = Job.objects.create(
-            id=uuid.uuid1(),
-            route=self.route,
+            id=uuid.uuid4(),
+            route=route,
         )
 
-        request = self.factory.get(f"/api/job/{self.job.id}")
+        request = _FACTORY.get(f"/api/job/{self.job.id}")
 
-        response = JobView.as_view()(request, id=self.job.id)
+        response = _JOB_VIEW(request, id=self.job.id)
 
         assert response.status_code == 200
 
         assert response.data.get("status") == "PENDING"
 
-    def test_get_status_complete(self):
+    def test_get_status_complete(self, route):
 
-        self.setUp()
+        # status comes from the mocked task state, the route only needs to look calculated
+        route.calculated = timezone.now()
+        route.save(update_fields=["calculated"])
 
         with patch(
             "polarrouteserver.route_api.views.AsyncResult.state",
@@ -533,30 +442,23 @@ class TestRouteStatus:
             mock_job_status.return_value = celery.states.SUCCESS
 
             self.job = Job.objects.create(
-                id=uuid.uuid1(),
-                route=self.route,
+                id=uuid.uuid4(),
+                route=route,
             )
 
-            request = self.factory.get(f"/api/job/{self.job.id}")
+            request = _FACTORY.get(f"/api/job/{self.job.id}")
 
-            response = JobView.as_view()(request, id=self.job.id)
+            response = _JOB_VIEW(request, id=self.job.id)
 
             assert response.status_code == 200
             assert response.data.get("status") == "SUCCESS"
             assert "route_url" in response.data
 
-    def test_request_out_of_mesh(self):
-
-        self.setUp()
-
-        with open(settings.TEST_MESH_PATH) as f:
-            mesh = json.load(f)
+    def test_request_out_of_mesh(self, test_mesh):
 
         # Request a point that is out of mesh
-        lat_min = mesh["config"]["mesh_info"]["region"]["lat_min"]
-        lat_max = mesh["config"]["mesh_info"]["region"]["lat_max"]
-        lon_min = mesh["config"]["mesh_info"]["region"]["long_min"]
-        lon_max = mesh["config"]["mesh_info"]["region"]["long_max"]
+        lat_min, lat_max = test_mesh.lat_min, test_mesh.lat_max
+        lon_min, lon_max = test_mesh.lon_min, test_mesh.lon_max
 
         data = {
             "start_lat": lat_min - 5,
@@ -566,48 +468,35 @@ class TestRouteStatus:
         }
 
         # make route request
-        request = self.factory.post(
+        request = _FACTORY.post(
             "/api/route", data=data, format="json"
         )
 
-        # using try except to ignore deliberate error in celery task in test envrionment
-        # in production, celery handles this
-        try:
-            post_response = RouteRequestView.as_view()(request)
-        except AssertionError:
-            pass
+        # no mesh is found, so no task is started
+        post_response = RouteRequestView.as_view()(request)
 
         assert post_response.status_code == 404
         assert post_response.data["error"] == "No mesh available."
 
 
-@pytest.mark.usefixtures("celery_app", "celery_worker", "celery_enable_logging")
 @pytest.mark.django_db
 class TestCancelRoute:
 
     pytestmark = pytest.mark.django_db
 
-    def setUp(self):
-        self.factory = APIRequestFactory()
-        mesh = add_test_mesh_to_db()
-        self.route = Route.objects.create(
-            start_lat=1.1, start_lon=1.1, end_lat=2.0, end_lon=2.0, mesh=mesh
-        )
-
-    def test_cancel_route(self):
+    def test_cancel_route(self, route):
 
-        self.setUp()
         self.job = Job.objects.create(
-            id=uuid.uuid1(),
-            route=self.route,
+            id=uuid.uuid4(),
+            route=route,
         )
 
         # Store route ID for checking deletion later
-        route_id = self.route.id
+        route_id = route.id
         
-        request = self.factory.delete(f"/api/job/{self.job.id}")
+        request = _FACTORY.delete(f"/api/job/{self.job.id}")
 
-        response = JobView.as_view()(request, id=self.job.id)
+        response = _JOB_VIEW(request, id=self.job.id)
 
         assert response.status_code == 202
         
@@ -628,12 +517,11 @@ class TestCancelRoute:
         """
         Test that attempting to cancel a non-existent job returns 404.
         """
-        self.setUp()
-        
+
         fake_job_id = uuid.uuid4()
-        request = self.factory.delete(f"/api/job/{fake_job_id}")
+        request = _FACTORY.delete(f"/api/job/{fake_job_id}")
 
-        response = JobView.as_view()(request, id=fake_job_id)
+        response = _JOB_VIEW(request, id=fake_job_id)
 
         assert response.status_code == 404
         assert "error" in response.data
@@ -645,17 +533,17 @@ class TestRouteDetailView(TestCase):
     Test case for the RouteDetailView endpoint that returns route data by route ID.
     """
 
-    def setUp(self):
-        self.factory = APIRequestFactory()
-        self.mesh = add_test_mesh_to_db()
-        
+    @classmethod
+    def setUpTestData(cls):
+        cls.mesh = add_test_mesh_to_db()
+
         # Create a test route with minimal data
-        self.route = Route.objects.create(
+        cls.route = Route.objects.create(
             start_lat=60.0,
             start_lon=-1.0,
             end_lat=61.0,
             end_lon=-2.0,
-            mesh=self.mesh,
+            mesh=cls.mesh,
             start_name="Test Start",
             end_name="Test End",
             json=None,
@@ -668,7 +556,7 @@ class TestRouteDetailView(TestCase):
         """
         Test successful retrieval of route data by ID.
         """
-        request = self.factory.get(f"/api/route/{self.route.id}")
+        request = _FACTORY.get(f"/api/route/{self.route.id}")
         response = RouteDetailView.as_view()(request, id=self.route.id)
 
         self.assertEqual(response.status_code, 200)
@@ -679,12 +567,26 @@ class TestRouteDetailView(TestCase):
         self.assertIn("error", response.data)
         self.assertIn("polarrouteserver-version", response.data)
 
+    def test_get_route_defers_mesh_json(self):
+        """
+        Test that the route and its mesh metadata are fetched together, without the mesh json.
+        """
+        request = _FACTORY.get(f"/api/route/{self.route.id}")
+        # route with mesh, and tags
+        with self.assertNumQueries(2) as queries:
+            response = RouteDetailView.as_view()(request, id=self.route.id)
+
+        self.assertEqual(response.status_code, 200)
+        route_sql = queries.captured_queries[0]["sql"]
+        self.assertIn('"route_api_mesh"."name"', route_sql)
+        self.assertNotIn('"route_api_mesh"."json"', route_sql)
+
     def test_get_route_not_found(self):
         """
         Test that requesting a non-existent route ID returns 404.
         """
         non_existent_id = 99999
-        request = self.factory.get(f"/api/route/{non_existent_id}")
+        request = _FACTORY.get(f"/api/route/{non_existent_id}")
         response = RouteDetailView.as_view()(request, id=non_existent_id)
 
         self.assertEqual(response.status_code, 404)
@@ -704,7 +606,7 @@ class TestRouteDetailView(TestCase):
             # No optional fields like start_name, end_name, json, etc.
         )
 
-        request = self.factory.get(f"/api/route/{minimal_route.id}")
+        request = _FACTORY.get(f"/api/route/{minimal_route.id}")
         response = RouteDetailView.as_view()(request, id=minimal_route.id)
 
         self.assertEqual(response.status_code, 200)
@@ -719,35 +621,44 @@ class TestRouteDetailView(TestCase):
 
 class TestGetRecentRoutesAndMesh(TestCase):
 
-    def setUp(self):
-        self.factory = APIRequestFactory()
-        self.mesh = add_test_mesh_to_db()
+    @classmethod
+    def setUpTestData(cls):
+        cls.mesh = add_test_mesh_to_db()
         # Create routes with calculated timestamps so they'll be found by the recent routes filter
         now = timezone.now()
         within_24_hours = now - timedelta(hours=18)
         longer_than_24_hours = now - timedelta(hours=25)
-        self.route1 = Route.objects.create(
-            start_lat=0.0, start_lon=0.0, end_lat=0.0, end_lon=0.0, 
-            mesh=self.mesh, calculated=now, requested=now,
-        )
-        self.route2 = Route.objects.create(
-            start_lat=1.0, start_lon=1.0, end_lat=1.0, end_lon=0.0, 
-            mesh=self.mesh, calculated=within_24_hours, requested=within_24_hours,
-        )
-        self.route3 = Route.objects.create(
-            start_lat=1.0, start_lon=1.0, end_lat=1.0, end_lon=0.0, 
-            mesh=self.mesh, calculated=longer_than_24_hours, requested=longer_than_24_hours,
-        )
-        
-        self.job1 = Job.objects.create(id=uuid.uuid1(), route=self.route1)
-        self.job2 = Job.objects.create(id=uuid.uuid1(), route=self.route2)
-        self.job3 = Job.objects.create(id=uuid.uuid1(), route=self.route3)
+        cls.route1, cls.route2, cls.route3 = Route.objects.bulk_create([
+            Route(
+                start_lat=0.0, start_lon=0.0, end_lat=0.0, end_lon=0.0,
+                mesh=cls.mesh, calculated=now, requested=now,
+            ),
+            Route(
+                start_lat=1.0, start_lon=1.0, end_lat=1.0, end_lon=0.0,
+                mesh=cls.mesh, calculated=within_24_hours, requested=within_24_hours,
+            ),
+            Route(
+                start_lat=1.0, start_lon=1.0, end_lat=1.0, end_lon=0.0,
+                mesh=cls.mesh, calculated=longer_than_24_hours, requested=longer_than_24_hours,
+            ),
+        ])
+
+        cls.job1, cls.job2, cls.job3 = Job.objects.bulk_create([
+            Job(id=uuid.uuid4(), route=route)
+            for route in (cls.route1, cls.route2, cls.route3)
+        ])
+
+    def setUp(self):
+        # the tags lookup needs the route content type, which is only queried until
+        # django has cached it, so warm the cache to keep query counts the same
+        ContentType.objects.get_for_model(Route)
 
     def test_recent_routes_request(self):
 
-        request = self.factory.get(f"/api/recent_routes")
+        request = _FACTORY.get(f"/api/recent_routes")
 
-        response = RecentRoutesView.as_view()(request)
+        with self.assertNumQueries(_RECENT_ROUTES_NUM_QUERIES):
+            response = RecentRoutesView.as_view()(request)
 
         assert response.status_code == 200
         assert "routes" in response.data
@@ -756,7 +667,7 @@ class TestGetRecentRoutesAndMesh(TestCase):
 
     def test_recent_routes_response_structure(self):
         """Test that RecentRoutesView response has correct structure and field types"""
-        request = self.factory.get("/api/recent_routes")
+        request = _FACTORY.get("/api/recent_routes")
         response = RecentRoutesView.as_view()(request)
 
         # Top level response structure
@@ -811,24 +722,23 @@ class TestGetRecentRoutesAndMesh(TestCase):
 
     def test_recent_routes_status_calculation(self):
         """Test that status is calculated correctly based on route state"""
-        # Create route without calculated timestamp (PENDING)
-        pending_route = Route.objects.create(
-            start_lat=2.0, start_lon=2.0, end_lat=2.0, end_lon=2.0,
-            mesh=self.mesh
-        )
+        routes = Route.objects.bulk_create([
+            # Route without calculated timestamp (PENDING)
+            Route(
+                start_lat=2.0, start_lon=2.0, end_lat=2.0, end_lon=2.0,
+                mesh=self.mesh
+            ),
+            # Route with error info (FAILURE)
+            Route(
+                start_lat=3.0, start_lon=3.0, end_lat=3.0, end_lon=3.0,
+                mesh=self.mesh,
+                info="Route calculation error occurred"
+            ),
+        ])
         # Job is required for route to appear in recent routes query
-        Job.objects.create(id=uuid.uuid4(), route=pending_route)
-        
-        # Create route with error info (FAILURE)
-        error_route = Route.objects.create(
-            start_lat=3.0, start_lon=3.0, end_lat=3.0, end_lon=3.0,
-            mesh=self.mesh,
-            info="Route calculation error occurred"
-        )
-        # Job is required for route to appear in recent routes query  
-        Job.objects.create(id=uuid.uuid4(), route=error_route)
+        Job.objects.bulk_create([Job(id=uuid.uuid4(), route=route) for route in routes])
 
-        request = self.factory.get("/api/recent_routes")
+        request = _FACTORY.get("/api/recent_routes")
         response = RecentRoutesView.as_view()(request)
 
         routes_by_lat = {route["start_lat"]: route for route in response.data["routes"]}
@@ -843,25 +753,9 @@ class TestGetRecentRoutesAndMesh(TestCase):
         # Error route should be FAILURE  
         assert routes_by_lat[3.0]["status"] == "FAILURE"
 
-    def test_recent_routes_no_content_response(self):
-        """Test response when no routes exist for today returns 200 OK with empty array"""
-        # Clear all routes created in setUp
-        Route.objects.all().delete()
-        
-        request = self.factory.get("/api/recent_routes")
-        response = RecentRoutesView.as_view()(request)
-        
-        assert response.status_code == 200
-        assert "routes" in response.data
-        assert response.data["routes"] == []
-        assert "polarrouteserver-version" in response.data
-        assert isinstance(response.data["polarrouteserver-version"], str)
-        assert "message" in response.data
-        assert "No recent routes found" in response.data["message"]
-
     def test_recent_routes_includes_job_info_when_present(self):
         """Test that job_id and job_status_url are included when job exists"""
-        request = self.factory.get("/api/recent_routes") 
+        request = _FACTORY.get("/api/recent_routes") 
         response = RecentRoutesView.as_view()(request)
         
         routes = response.data["routes"]
@@ -874,9 +768,11 @@ class TestGetRecentRoutesAndMesh(TestCase):
 
     def test_recent_routes_includes_mesh_info(self):
         """Test that mesh information is included correctly"""
-        request = self.factory.get("/api/recent_routes")
-        response = RecentRoutesView.as_view()(request)
-        
+        request = _FACTORY.get("/api/recent_routes")
+        # mesh info comes from the routes query, not one query per route
+        with self.assertNumQueries(_RECENT_ROUTES_NUM_QUERIES):
+            response = RecentRoutesView.as_view()(request)
+
         routes = response.data["routes"]
         for route in routes:
             assert "mesh" in route
@@ -890,7 +786,7 @@ class TestGetRecentRoutesAndMesh(TestCase):
 
     def test_recent_routes_datetime_formatting(self):
         """Test that datetime fields are properly formatted as ISO strings"""
-        request = self.factory.get("/api/recent_routes")
+        request = _FACTORY.get("/api/recent_routes")
         response = RecentRoutesView.as_view()(request)
         
         routes = response.data["routes"]
@@ -910,7 +806,7 @@ class TestGetRecentRoutesAndMesh(TestCase):
 
     def test_recent_routes_url_generation(self):
         """Test that URLs are properly generated with request context"""
-        request = self.factory.get("/api/recent_routes")
+        request = _FACTORY.get("/api/recent_routes")
         response = RecentRoutesView.as_view()(request)
         
         routes = response.data["routes"]
@@ -929,7 +825,6 @@ class TestGetRecentRoutesAndMesh(TestCase):
     def test_recent_routes_includes_tags(self):
         """Test that recent routes include tag information."""
         # Create a route with tags
-        from polarrouteserver.route_api.models import Route
         route = Route.objects.create(
             start_lat=1.0,
             start_lon=1.0,
@@ -938,8 +833,10 @@ class TestGetRecentRoutesAndMesh(TestCase):
         )
         route.tags.add("test_tag", "recent_test")
         
-        request = self.factory.get("/api/recent_routes")
-        response = RecentRoutesView.as_view()(request)
+        request = _FACTORY.get("/api/recent_routes")
+        # tags for all routes are fetched together
+        with self.assertNumQueries(_RECENT_ROUTES_NUM_QUERIES):
+            response = RecentRoutesView.as_view()(request)
         
         self.assertEqual(response.status_code, 200)
         routes = response.data["routes"]
@@ -959,7 +856,7 @@ class TestGetRecentRoutesAndMesh(TestCase):
 
     def test_mesh_get(self):
 
-        request = self.factory.get(f"/api/mesh/{self.mesh.id}")
+        request = _FACTORY.get(f"/api/mesh/{self.mesh.id}")
 
         response = MeshView.as_view()(request, self.mesh.id)
 
@@ -970,7 +867,7 @@ class TestGetRecentRoutesAndMesh(TestCase):
     def test_mesh_not_found(self):
         """Test that requesting a non-existent mesh returns 404."""
         non_existent_id = 9999
-        request = self.factory.get(f"/api/mesh/{non_existent_id}")
+        request = _FACTORY.get(f"/api/mesh/{non_existent_id}")
 
         response = MeshView.as_view()(request, id=non_existent_id)
 
@@ -978,16 +875,32 @@ class TestGetRecentRoutesAndMesh(TestCase):
         assert "error" in response.data
         assert f"Mesh with id {non_existent_id} not found" in response.data["error"]
 
+class TestGetRecentRoutesEmpty(TestCase):
+    """Test case for the recent routes endpoint when no routes exist."""
+
+    def test_recent_routes_no_content_response(self):
+        """Test response when no routes exist for today returns 200 OK with empty array"""
+        request = _FACTORY.get("/api/recent_routes")
+        response = RecentRoutesView.as_view()(request)
+        
+        assert response.status_code == 200
+        assert "routes" in response.data
+        assert response.data["routes"] == []
+        assert "polarrouteserver-version" in response.data
+        assert isinstance(response.data["polarrouteserver-version"], str)
+        assert "message" in response.data
+        assert "No recent routes found" in response.data["message"]
+
+
 class TestGetLocations(TestCase):
     fixtures = ["locations_bas.json"]
 
     def setUp(self):
-        self.factory = APIRequestFactory()
         self.location_id = 1
         self.location_expected_name = "Bird Island"
 
     def test_location_list_request(self):
-        request = self.factory.get(f"/api/location")
+        request = _FACTORY.get(f"/api/location")
 
         response = LocationViewSet.as_view({'get': 'list'})(request)
 
@@ -995,7 +908,7 @@ class TestGetLocations(TestCase):
         assert len(response.data) > 1
     
     def test_location_single_request(self):
-        request = self.factory.get(f"/api/location/{self.location_id}")
+        request = _FACTORY.get(f"/api/location/{self.location_id}")
 
         response = LocationViewSet.as_view({'get': 'retrieve'})(request, pk=self.location_id)
 
@@ -1005,7 +918,7 @@ class TestGetLocations(TestCase):
     def test_location_not_found(self):
         """Test that requesting a non-existent location returns 404."""
         non_existent_id = 99999
-        request = self.factory.get(f"/api/location/{non_existent_id}")
+        request = _FACTORY.get(f"/api/location/{non_existent_id}")
 
         response = LocationViewSet.as_view({'get': 'retrieve'})(request, pk=non_existent_id)
 
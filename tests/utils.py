@@ -1,25 +1,52 @@
-import datetime, hashlib, json
+import datetime, hashlib
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import orjson as _json
+except ImportError:
+    # orjson is in the dev extras, fall back to the standard library without it
+    import json as _json
 
 from polarrouteserver.route_api.models import Mesh
 
 from django.conf import settings
 from django.utils import timezone
 
+def load_json(path):
+    """utility function to parse a JSON fixture file"""
+    return _json.loads(Path(path).read_bytes())
+
+def dump_json(data):
+    """utility function to serialise a JSON request body"""
+    return _json.dumps(data)
+
+@lru_cache(maxsize=1)
+def _read_mesh_file(path, mtime_ns):
+    """read and hash a mesh file once, re-reading only if the file is modified"""
+    file_contents = Path(path).read_bytes()
+    return file_contents, hashlib.md5(file_contents).hexdigest()
+
 def add_test_mesh_to_db():
-    """utility function to add a mesh to the test db"""
-    with open(settings.TEST_MESH_PATH, 'r') as f:
-        file_contents = f.read().encode('utf-8')
-        md5 = hashlib.md5(file_contents).hexdigest()
-        mesh = json.loads(file_contents)
-    return Mesh.objects.create(
-            valid_date_start = timezone.now().date() - datetime.timedelta(days=3),
-            valid_date_end = timezone.now().date(),
-            created = datetime.datetime.now(datetime.timezone.utc),
-            md5 = md5,
-            meshiphi_version = "test",
-            lat_min = mesh["config"]["mesh_info"]["region"]["lat_min"],
-            lat_max = mesh["config"]["mesh_info"]["region"]["lat_max"],
-            lon_min = mesh["config"]["mesh_info"]["region"]["long_min"],
-            lon_max = mesh["config"]["mesh_info"]["region"]["long_max"],
-            json = mesh
-        )
\ No newline at end of file
+    """utility function to add a mesh to the test db, or return it if already added"""
+    path = Path(settings.TEST_MESH_PATH)
+    file_contents, md5 = _read_mesh_file(path, path.stat().st_mtime_ns)
+    # parsed on every call, tests are free to modify the mesh json
+    mesh_json = _json.loads(file_contents)
+    region = mesh_json["config"]["mesh_info"]["region"]
+    now = timezone.now()
+    mesh, _ = Mesh.objects.get_or_create(
+        md5=md5,
+        defaults={
+            "valid_date_start": now.date() - datetime.timedelta(days=3),
+            "valid_date_end": now.date(),
+            "created": now,
+            "meshiphi_version": "test",
+            "lat_min": region["lat_min"],
+            "lat_max": region["lat_max"],
+            "lon_min": region["long_min"],
+            "lon_max": region["long_max"],
+            "json": mesh_json,
+        },
+    )
+    return mesh